@@ -10,18 +10,84 @@
 #              LinkedIn directly.
 # =============================================================================
 
+import csv
+import functools
 import requests
+import openpyxl
 import os
 import json
 import re
-import time
-import pandas as pd
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from math import ceil
+from urllib.parse import urlsplit
+from urllib3.util import Retry
+
+# orjson parses the multi-KB API responses several times faster than the
+# stdlib json module; fall back transparently when it isn't installed.
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = lambda obj: orjson.dumps(obj).decode()
+except ImportError:
+    _loads, _dumps = json.loads, json.dumps
+
+# Prefer Google's RE2 engine when available (pip install google-re2): it runs
+# in linear time with no backtracking, which matters for the phone pattern's
+# optional groups. Its C++ matcher also releases the GIL, so snippet scanning
+# runs truly in parallel with the background page fetches instead of taking
+# turns with them. Falls back to the stdlib engine so the tool always runs.
+try:
+    import re2 as _regex_engine
+except ImportError:
+    _regex_engine = re
+
+# --- Regex patterns (compiled once at import, reused on every snippet) ---
+# Email and phone alternatives are fused into one pattern so each snippet is
+# scanned end-to-end once instead of twice; matches are bucketed by group.
+_EMAIL_PATTERN = r'[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,7}'
+_PHONE_PATTERN = r'(?:\+?\d{1,3}[-.\s]?)?\(?\d{2,4}\)?[-.\s]?\d{3,4}[-.\s]?\d{3,4}'
+_CONTACT_RE = _regex_engine.compile(f'(?P<email>{_EMAIL_PATTERN})|(?P<phone>{_PHONE_PATTERN})')
+_EMAIL_RE = _regex_engine.compile(_EMAIL_PATTERN)
+_HAS_DIGIT = _regex_engine.compile(r'\d\d\d')
 
 # --- Configuration ---
 CONFIG_FILE = 'google_search_config.json'
-HISTORY_FILE = 'search_history.json'
+HISTORY_FILE = 'search_history.jsonl'
 OUTPUT_FOLDER = 'extracted_leads'
+PAGE_SIZE = 10          # Results per Google Custom Search page
+MAX_PARALLEL_PAGES = 5  # Pages fetched concurrently (keeps us under Google's QPS)
+SEARCH_URL = 'https://www.googleapis.com/customsearch/v1'
+LEAD_FIELDS = ['Name', 'Email', 'Phone', 'LinkedIn']
+
+# Transient failures (429/5xx) are retried with exponential backoff, honoring
+# any Retry-After header the API sends.
+_RETRIES = Retry(total=3, backoff_factor=0.5,
+                 status_forcelist=[429, 500, 502, 503, 504],
+                 respect_retry_after_header=True)
+
+def _build_session(use_cache=True):
+    """Builds the shared HTTP session with keep-alive and connection pooling.
+
+    When requests-cache is installed (pip install requests-cache), responses
+    are cached in a local SQLite file for 24 h so rerunning the same search
+    costs no API quota. Pass --no-cache on the command line to bypass it.
+    """
+    session = None
+    if use_cache:
+        try:
+            from requests_cache import CachedSession
+            session = CachedSession('.gsearch_cache', backend='sqlite', expire_after=86400)
+        except ImportError:
+            pass
+    if session is None:
+        session = requests.Session()
+    session.mount('https://', requests.adapters.HTTPAdapter(
+        pool_connections=4, pool_maxsize=8, max_retries=_RETRIES))
+    return session
+
+_SESSION = _build_session()
 
 def display_linkedin_logo():
     # Displays a minimal "in" logo for LinkedIn-Lead-Extractor.
@@ -37,64 +103,104 @@ def display_linkedin_logo():
     """
     print(logo)
 
+@functools.lru_cache(maxsize=1)
 def load_or_create_config():
-    """Loads API configuration from a file or prompts the user to create it."""
+    """Loads API configuration from a file or prompts the user to create it.
+
+    The parsed config is cached for the process lifetime, so callers that
+    trigger repeated extractions reuse it instead of re-reading the file.
+    Call load_or_create_config.cache_clear() to force a reload.
+    """
     if os.path.exists(CONFIG_FILE):
         with open(CONFIG_FILE, 'r') as f:
-            return json.load(f)
+            return _loads(f.read())
     else:
         print("--- Google API Configuration (First-time setup) ---")
         api_key = input("Enter your Google Custom Search API key: ")
         cx = input("Enter your Google Custom Search Engine ID (cx): ")
         config = {"api_key": api_key, "cx": cx}
         with open(CONFIG_FILE, 'w') as f:
-            json.dump(config, f)
+            f.write(_dumps(config))
         print("✅ Configuration saved to google_search_config.json\n")
         return config
 
-def google_search(query, api_key, cx, start_index=1, max_retries=3):
-    """Performs a Google search and handles retries and quota errors."""
-    for attempt in range(max_retries):
+def google_search(query, api_key, cx, start_index=1):
+    """Performs a Google search; the session retries transient errors with backoff."""
+    params = {'q': query, 'key': api_key, 'cx': cx, 'start': start_index}
+    try:
+        res = _SESSION.get(SEARCH_URL, params=params, timeout=15)
+    except requests.exceptions.RequestException as e:
+        print(f"❌ Network error: {e}")
+        return []
+
+    if res.status_code == 200:
         try:
-            url = f"https://www.googleapis.com/customsearch/v1?q={query}&key={api_key}&cx={cx}&start={start_index}"
-            res = requests.get(url, timeout=15)
-            if res.status_code == 200:
-                return res.json().get('items', [])
-            elif "quota" in res.text.lower():
-                print("🚫 Google API quota limit reached. Cannot continue.")
-                return []
-            else:
-                print(f"⚠️ API Error: {res.status_code} - {res.text}")
-        except requests.exceptions.RequestException as e:
-            print(f"Network error on attempt {attempt + 1}/{max_retries}: {e}")
-        
-        if attempt < max_retries - 1:
-            print(f"Retrying in 3 seconds...")
-            time.sleep(3)
-            
-    print("❌ Failed to fetch results after multiple retries.")
+            return _loads(res.content).get('items', [])
+        except ValueError as e:
+            print(f"⚠️ Malformed API response: {e}")
+            return []
+
+    try:
+        status = _loads(res.content).get('error', {}).get('status', '')
+    except ValueError:
+        status = ''
+    if status == 'RESOURCE_EXHAUSTED' or "quota" in res.text.lower():
+        print("🚫 Google API quota limit reached. Cannot continue.")
+    else:
+        print(f"⚠️ API Error: {res.status_code} - {res.text}")
     return []
 
-def extract_emails(text):
-    """Uses regex to find unique email addresses from a block of text."""
-    return list(set(re.findall(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,7}\b', text)))
+def google_search_pages(query, api_key, cx, start_indexes):
+    """Fetches several result pages concurrently and flattens them in order."""
+    with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_PAGES, len(start_indexes))) as pool:
+        pages = pool.map(lambda s: google_search(query, api_key, cx, start_index=s), start_indexes)
+    return [item for page in pages for item in page]
+
+def extract_contacts(text):
+    """Finds unique email addresses and phone numbers in one scan of the text."""
+    # Any phone match contains at least three consecutive digits, so when the
+    # cheap prefilter finds none the phone alternation - whose optional prefix
+    # forces match attempts at every position - is skipped entirely.
+    if not _HAS_DIGIT.search(text):
+        return list({*_EMAIL_RE.findall(text)}), []
+    emails, phones = set(), set()
+    for m in _CONTACT_RE.finditer(text):
+        if m.group('email'):
+            emails.add(m.group('email'))
+        else:
+            phones.add(m.group('phone'))
+    return list(emails), list(phones)
 
-def extract_phones(text):
-    """Uses a flexible regex to find unique phone numbers."""
-    return list(set(re.findall(r'(?:\+?\d{1,3}[-.\s]?)?\(?\d{2,4}\)?[-.\s]?\d{3,4}[-.\s]?\d{3,4}', text)))
+def _canon(url):
+    """Canonicalizes a URL for dedup: lowercase host, no query/fragment/trailing slash."""
+    p = urlsplit(url)
+    return f"{p.scheme}://{p.netloc.lower()}{p.path.rstrip('/')}"
 
 def save_history(entry):
-    """Saves a record of the search to a history file."""
+    """Appends a record of the search to the history file (JSON Lines)."""
+    with open(HISTORY_FILE, 'a', buffering=1 << 16) as f:
+        f.write(_dumps(entry) + '\n')
+
+def load_history():
+    """Returns all past search records, skipping any corrupted lines."""
     history = []
     if os.path.exists(HISTORY_FILE):
         with open(HISTORY_FILE, 'r') as f:
-            try:
-                history = json.load(f)
-            except json.JSONDecodeError:
-                history = [] # Overwrite if corrupted
-    history.append(entry)
-    with open(HISTORY_FILE, 'w') as f:
-        json.dump(history, f, indent=2)
+            for line in f:
+                try:
+                    history.append(_loads(line))
+                except ValueError:
+                    continue # Skip if corrupted
+    return history
+
+def _fast_to_excel(rows, path):
+    """Writes lead records to .xlsx via openpyxl's streaming write-only mode."""
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet()
+    ws.append(LEAD_FIELDS)
+    for row in rows:
+        ws.append([row.get(field, '') for field in LEAD_FIELDS])
+    wb.save(path)
 
 def ensure_output_folder():
     """Creates the output folder if it doesn't exist"""
@@ -119,26 +225,52 @@ def main():
     query = f'site:linkedin.com/in/ "{title_input}" "{area}" "{email_provider}"'
     print(f"\nSearching Google with query: {query}\n")
     start_index = 1
-    
+    pages_fetched = 0
+    # Single-slot prefetcher: the next window downloads in the background
+    # while the current window's snippets are being processed.
+    prefetcher = ThreadPoolExecutor(max_workers=1)
+    next_window = None  # (future, pages) fetched ahead of time
+
     while len(collected) < target_count:
         print(f"Searching... Found {len(collected)}/{target_count} contacts so far.")
-        results = google_search(query, api_key, cx, start_index=start_index)
+        if next_window is not None:
+            future, pages = next_window
+            results = future.result()
+        else:
+            pages = min(MAX_PARALLEL_PAGES, ceil((target_count - len(collected)) / PAGE_SIZE))
+            starts = range(start_index, start_index + pages * PAGE_SIZE, PAGE_SIZE)
+            results = google_search_pages(query, api_key, cx, starts)
         if not results:
             print("No more Google results found.")
             break
 
+        # Kick off the next window before touching these results so the API
+        # round trip overlaps the regex/dedup work below.
+        next_pages = min(MAX_PARALLEL_PAGES, ceil(max(target_count - len(collected), 1) / PAGE_SIZE))
+        next_start = start_index + pages * PAGE_SIZE
+        next_starts = range(next_start, next_start + next_pages * PAGE_SIZE, PAGE_SIZE)
+        next_window = (prefetcher.submit(google_search_pages, query, api_key, cx, next_starts),
+                       next_pages)
+
         for item in results:
             link = item.get('link')
-            if not link or link in seen_links:
+            if not link:
+                continue
+            canon_link = _canon(link)
+            if canon_link in seen_links:
                 continue
-            seen_links.add(link)
+            seen_links.add(canon_link)
 
-            name = item.get('title', '').split(' - ')[0].strip()
+            title = item.get('title') or ''
+            name = title.partition(' - ')[0].strip()
             snippet = item.get('snippet', '')
             search_text = name + " " + snippet
 
-            emails = extract_emails(search_text)
-            phones = extract_phones(search_text)
+            # No '@' means no email can match, and items without an email are
+            # discarded below anyway - skip the regex scan entirely.
+            if '@' not in search_text:
+                continue
+            emails, phones = extract_contacts(search_text)
             
             if emails:
                 collected.append({
@@ -152,19 +284,36 @@ def main():
             if len(collected) >= target_count:
                 break
         
-        start_index += 10
+        start_index += pages * PAGE_SIZE
+        pages_fetched += pages
+
+        # Stop when the observed hit rate says the target is out of reach -
+        # fetching ever more pages of duplicate or email-less results would
+        # only burn quota. The rate is floored at 5% so a slow first window
+        # isn't fatal; worst case the budget is 2x the target in pages. Only
+        # the failure path is budgeted: once the target is reached the while
+        # condition ends the loop cleanly.
         if len(collected) < target_count:
-            time.sleep(2)
+            hit_rate = max(len(collected) / (pages_fetched * PAGE_SIZE), 0.05)
+            if pages_fetched >= ceil(target_count / hit_rate / PAGE_SIZE):
+                print("Stopping: hit rate too low to reach the target within the page budget.")
+                break
+
+    # Drop any speculative window still queued so the process doesn't hang
+    # around after the summary waiting for a fetch nobody will read.
+    prefetcher.shutdown(wait=False, cancel_futures=True)
 
     if collected:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M")
         base_filename = f"{title_input}_{area}_{timestamp}".replace(" ", "_")
 
-        df = pd.DataFrame(collected)
         excel_file = os.path.join(OUTPUT_FOLDER, base_filename + ".xlsx")
         csv_file = os.path.join(OUTPUT_FOLDER, base_filename + ".csv")
-        df.to_excel(excel_file, index=False)
-        df.to_csv(csv_file, index=False)
+        _fast_to_excel(collected, excel_file)
+        with open(csv_file, 'w', newline='', buffering=1 << 20, encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=LEAD_FIELDS)
+            writer.writeheader()
+            writer.writerows(collected)
 
         print(f"\n✅ Success! Saved {len(collected)} contacts:")
         print(f"   - Excel file: {excel_file}")
@@ -182,4 +331,6 @@ def main():
         print("\n❌ No data was collected. Try a broader search (e.g., different title or area).")
 
 if __name__ == "__main__":
+    if '--no-cache' in sys.argv:
+        _SESSION = _build_session(use_cache=False)
     main()
\ No newline at end of file